@@ -1,25 +1,35 @@
+import functools
 import logging
 
-import yaml
 from psycopg_pool import ConnectionPool
 
+from indexer.helpers.config import load_config
+
 log = logging.getLogger("muscat_indexer")
-idx_config: dict = yaml.full_load(open("./index_config.yml"))  # noqa: SIM115
 
-config: dict = {
-    "user": idx_config["postgres"]["username"],
-    "password": idx_config["postgres"]["password"],
-    "db": idx_config["postgres"]["cantus_db"],
-    "host": idx_config["postgres"]["server"],
-}
 
-server_connection: str
-if idx_config["postgres"]["server"]:
-    server_connection = f"hostaddr={config['host']}"
-else:
-    server_connection = ""
+@functools.cache
+def get_postgres_pool() -> ConnectionPool:
+    """
+    Returns the shared PostgreSQL connection pool for the Cantus database. It is created
+    the first time it is needed, rather than when this module is imported, so that runs
+    which skip this indexer do not open any connections to it.
+    """
+    postgres_config: dict = load_config("./index_config.yml")["postgres"]
+
+    config: dict = {
+        "user": postgres_config["username"],
+        "password": postgres_config["password"],
+        "db": postgres_config["cantus_db"],
+        "host": postgres_config["server"],
+    }
 
+    server_connection: str
+    if postgres_config["server"]:
+        server_connection = f"hostaddr={config['host']}"
+    else:
+        server_connection = ""
 
-postgres_pool = ConnectionPool(
-    f"{server_connection} dbname={config['db']} user={config['user']} password={config['password']}"
-)
+    return ConnectionPool(
+        f"{server_connection} dbname={config['db']} user={config['user']} password={config['password']}"
+    )
@@ -3,7 +3,7 @@ from typing import Any, Generator
 
 from psycopg.rows import dict_row
 
-from cantus_indexer.helpers.db import postgres_pool
+from cantus_indexer.helpers.db import get_postgres_pool
 from cantus_indexer.records.institution import create_institution_index_document
 from indexer.helpers.solr import record_indexer, submit_to_solr
 from indexer.helpers.utilities import parallelise, update_rism_document
@@ -14,7 +14,7 @@ log = logging.getLogger("muscat_indexer")
 def _get_unlinked_cantus_institutions(
     cfg: dict,
 ) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         # Only select institutions that have *published* sources attached to them.
         curs.execute("""SELECT DISTINCT cti.id AS id, cti.name AS name, cti.date_created AS created,
@@ -33,7 +33,7 @@ def _get_unlinked_cantus_institutions(
 def _get_linked_cantus_institutions(
     cfg: dict,
 ) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT cti.id AS id, ctii.identifier AS rism_id, cti.name AS name,
                 'institution' AS project_type
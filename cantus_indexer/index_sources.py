@@ -4,7 +4,7 @@ from typing import Any, Generator
 
 from psycopg.rows import dict_row
 
-from cantus_indexer.helpers.db import postgres_pool
+from cantus_indexer.helpers.db import get_postgres_pool
 from cantus_indexer.records.source import create_source_index_documents
 from indexer.exceptions import RequiredFieldException
 from indexer.helpers.solr import submit_to_solr
@@ -14,7 +14,7 @@ log = logging.getLogger("muscat_indexer")
 
 
 def _get_sources(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT cts.id AS id, cts.shelfmark AS shelfmark, cts.date AS source_date, cts.summary AS source_summary,
                     cts.description AS html_source_description, cts.image_link AS digital_images,
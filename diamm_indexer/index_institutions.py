@@ -3,7 +3,7 @@ from typing import Any, Generator
 
 from psycopg.rows import dict_row
 
-from diamm_indexer.helpers.db import postgres_pool
+from diamm_indexer.helpers.db import get_postgres_pool
 from diamm_indexer.records.organization import create_organization_index_document
 from indexer.helpers.solr import record_indexer, submit_to_solr
 from indexer.helpers.utilities import parallelise, update_rism_document
@@ -12,7 +12,7 @@ log = logging.getLogger("muscat_indexer")
 
 
 def _get_organizations(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT ddo.id AS id, ddo.name AS name, ddo.created AS created, ddo.updated AS updated,
                         (SELECT string_agg(DISTINCT
@@ -62,7 +62,7 @@ def _get_organizations(cfg: dict) -> Generator[list[dict[str, Any]], None, None]
 def _get_linked_diamm_organizations(
     cfg: dict,
 ) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT ddo.id AS id, ddoi.identifier AS rism_id, ddo.name AS name,
                         'organizations' AS project_type
@@ -88,7 +88,7 @@ def index_organizations(cfg: dict) -> bool:
 def _get_linked_diamm_archives(
     cfg: dict,
 ) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT dda.id AS id, ddai.identifier AS rism_id, dda.name AS name,
                         'archives' AS project_type
@@ -3,7 +3,7 @@ from typing import Any, Generator, Optional
 
 from psycopg.rows import dict_row
 
-from diamm_indexer.helpers.db import postgres_pool
+from diamm_indexer.helpers.db import get_postgres_pool
 from diamm_indexer.records.person import (
     create_person_index_document,
     get_date_statement,
@@ -16,7 +16,7 @@ log = logging.getLogger("muscat_indexer")
 
 
 def _get_people(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT ddp.id AS id, ddp.last_name AS last_name,
                 ddp.first_name AS first_name, ddp.earliest_year AS earliest_year,
@@ -59,7 +59,7 @@ ORDER BY ddp.id;""")
 
 
 def _get_linked_diamm_people(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT ddp.id AS id, ddpi.identifier AS rism_id,ddp.last_name AS last_name,
                             ddp.first_name AS first_name, ddp.earliest_year AS earliest_year,
@@ -3,7 +3,7 @@ from typing import Any, Generator
 
 from psycopg.rows import dict_row
 
-from diamm_indexer.helpers.db import postgres_pool
+from diamm_indexer.helpers.db import get_postgres_pool
 from diamm_indexer.records.source import create_source_index_documents
 from indexer.helpers.solr import record_indexer, submit_to_solr
 from indexer.helpers.utilities import parallelise, update_rism_document
@@ -12,7 +12,7 @@ log = logging.getLogger("muscat_indexer")
 
 
 def _get_sources(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT dds.id AS id, dds.name AS name, dds.shelfmark AS shelfmark, dds.start_date AS start_date,
                 dds.end_date AS end_date, dds.date_statement AS date_statement, dds.measurements AS measurements,
@@ -62,7 +62,7 @@ def _get_sources(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
 
 
 def _get_diamm_concordance(cfg: dict) -> Generator[list[dict[str, Any]], None, None]:
-    with postgres_pool.connection() as conn:
+    with get_postgres_pool().connection() as conn:
         curs = conn.cursor(row_factory=dict_row)
         curs.execute("""SELECT DISTINCT dds.id AS id, ddsa.identifier AS rism_id,
                         dds.name AS name, dds.shelfmark AS shelfmark, dda.siglum AS siglum
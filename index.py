@@ -3,19 +3,21 @@ import faulthandler
 import logging.config
 import os.path
 import sys
-import timeit
+import time
 from pathlib import Path
+from typing import Optional
 
 import sentry_sdk
-import yaml
 from sentry_sdk.integrations.logging import LoggingIntegration
 
 from cantus_indexer.index import clean_cantus, index_cantus
 
 # from cmo_indexer.index import index_cmo, clean_cmo
 from diamm_indexer.index import clean_diamm, index_diamm
+from indexer.helpers.config import load_config
 from indexer.helpers.db import run_preflight_queries
 from indexer.helpers.solr import (
+    commit_changes,
     empty_solr_core,
     reload_core,
     submit_to_solr,
@@ -32,12 +34,12 @@ from indexer.index_sources import index_sources
 from indexer.index_subjects import index_subjects
 from indexer.index_works import index_works
 
-faulthandler.enable()
+log = logging.getLogger("muscat_indexer")
 
-log_config: dict = yaml.full_load(open("logging.yml"))  # noqa: SIM115
 
-logging.config.dictConfig(log_config)
-log = logging.getLogger("muscat_indexer")
+def _configure_logging() -> None:
+    log_config: dict = load_config("logging.yml")
+    logging.config.dictConfig(log_config)
 
 
 def index_indexer(cfg: dict, start: float, end: float) -> bool:
@@ -56,6 +58,27 @@ def index_indexer(cfg: dict, start: float, end: float) -> bool:
     return check
 
 
+def init_sentry(cfg: dict) -> None:
+    # Set up sentry logging
+    sentry_logging = LoggingIntegration(
+        level=logging.ERROR,  # Capture info and above as breadcrumbs
+        event_level=logging.ERROR,  # Send errors as events
+    )
+
+    version: str = cfg["common"]["version"]
+    release: str = version
+
+    if version.startswith("v"):
+        release = version[1:]
+
+    sentry_sdk.init(
+        dsn=cfg["sentry"]["dsn"],
+        environment=cfg["sentry"]["environment"],
+        integrations=[sentry_logging],
+        release=f"muscatplus_indexer@{release}",
+    )
+
+
 def only_diamm(cfg: dict) -> bool:
     res: bool = True
 
@@ -112,7 +135,7 @@ def only_cantus(cfg: dict) -> bool:
 
 @elapsedtime
 def main(args: argparse.Namespace) -> bool:
-    idx_start: float = timeit.default_timer()
+    idx_start: float = time.perf_counter()
 
     cfg_filename: str = "./index_config.yml" if not args.config else args.config
 
@@ -122,31 +145,16 @@ def main(args: argparse.Namespace) -> bool:
         log.fatal("Could not find config file %s.", cfg_filename)
         return False
 
-    idx_config: dict = yaml.full_load(open(cfg_filename))  # noqa: SIM115
-
-    # Set up sentry logging
-    sentry_logging = LoggingIntegration(
-        level=logging.ERROR,  # Capture info and above as breadcrumbs
-        event_level=logging.ERROR,  # Send errors as events
-    )
-
-    version: str = idx_config["common"]["version"]
-    release: str = version
-
-    if version.startswith("v"):
-        release = version[1:]
+    # Take a copy, since the loaded configuration is shared and we add run-specific values to it.
+    idx_config: dict = dict(load_config(cfg_filename))
 
     # Add a parameter indicating whether this is a dry run to the config.
     idx_config.update({"dry": args.dry, "swap_cores": args.swap_cores})
 
+    # Dry runs never send anything anywhere, so don't pay for setting up Sentry.
     debug_mode: bool = idx_config["common"]["debug"]
-    if debug_mode is False:
-        sentry_sdk.init(
-            dsn=idx_config["sentry"]["dsn"],
-            environment=idx_config["sentry"]["environment"],
-            integrations=[sentry_logging],
-            release=f"muscatplus_indexer@{release}",
-        )
+    if debug_mode is False and not args.dry:
+        init_sentry(idx_config)
 
     # Track the status of the various sub-tasks by &= against a boolean.
     res = True
@@ -190,27 +198,31 @@ def main(args: argparse.Namespace) -> bool:
     if args.only_id:
         idx_config.update({"id": args.only_id})
 
+    # Resolve the exclusions once, so the dispatch loop only sees the record types it needs to index.
+    excluded: frozenset[str] = frozenset(args.exclude)
+    todo: list[str] = [rt for rt in inc if rt not in excluded]
+
     if not args.dry:
         res &= run_preflight_queries(idx_config)
 
-    for record_type in inc:
-        if record_type == "sources" and "sources" not in args.exclude:
+    for record_type in todo:
+        if record_type == "sources":
             res &= index_sources(idx_config)
-        elif record_type == "people" and "people" not in args.exclude:
+        elif record_type == "people":
             res &= index_people(idx_config)
-        elif record_type == "places" and "places" not in args.exclude:
+        elif record_type == "places":
             res &= index_places(idx_config)
-        elif record_type == "institutions" and "institutions" not in args.exclude:
+        elif record_type == "institutions":
             res &= index_institutions(idx_config)
-        elif record_type == "holdings" and "holdings" not in args.exclude:
+        elif record_type == "holdings":
             res &= index_holdings(idx_config)
-        elif record_type == "subjects" and "subjects" not in args.exclude:
+        elif record_type == "subjects":
             res &= index_subjects(idx_config)
-        elif record_type == "festivals" and "festivals" not in args.exclude:
+        elif record_type == "festivals":
             res &= index_liturgical_festivals(idx_config)
-        elif record_type == "digital-objects" and "digital-objects" not in args.exclude:
+        elif record_type == "digital-objects":
             res &= index_digital_objects(idx_config)
-        elif record_type == "works" and "works" not in args.exclude:
+        elif record_type == "works":
             res &= index_works(idx_config)
 
     if not args.skip_diamm:
@@ -223,7 +235,9 @@ def main(args: argparse.Namespace) -> bool:
     #     res &= index_cmo(idx_config)
 
     log.info("Finished indexing records, cleaning up.")
-    idx_end: float = timeit.default_timer()
+    solr_server: str = idx_config["solr"]["server"]
+    indexing_core: str = idx_config["solr"]["indexing_core"]
+    idx_end: float = time.perf_counter()
 
     # If, so far, all the results have been successful, and we're not in a dry run, then
     # add the final index record and reload the core.
@@ -232,19 +246,18 @@ def main(args: argparse.Namespace) -> bool:
         log.info("Adding indexer record.")
         res &= index_indexer(idx_config, idx_start, idx_end)
 
-        # force a core reload to ensure it's up-to-date
-        res &= reload_core(
-            idx_config["solr"]["server"], idx_config["solr"]["indexing_core"]
-        )
+        if args.swap_cores:
+            # The core is about to be swapped in, so a hard commit is enough to open a
+            # searcher on the new documents; a full core reload is not needed.
+            res &= commit_changes(idx_config)
+        else:
+            # force a core reload to ensure it's up-to-date
+            res &= reload_core(solr_server, indexing_core)
 
     # Finally, if all the previous statuses are True, we're supposed to swap the cores, and we're not in a dry run,
     # then consider that indexing was successful and swap the indexer core with the live core.
     if res and args.swap_cores and not args.dry:
-        res &= swap_cores(
-            idx_config["solr"]["server"],
-            idx_config["solr"]["indexing_core"],
-            idx_config["solr"]["live_core"],
-        )
+        res &= swap_cores(solr_server, indexing_core, idx_config["solr"]["live_core"])
 
     if not res:
         log.error("Indexing failed.")
@@ -254,15 +267,7 @@ def main(args: argparse.Namespace) -> bool:
     return res
 
 
-if __name__ == "__main__":
-    idx_pid = str(os.getpid())
-    pid_file: Path = Path("/tmp", "muscatplus_indexer.pid")  # noqa: S108
-    if pid_file.exists():
-        log.critical("Process is already running. Exiting")
-        sys.exit(1)
-
-    pid_file.write_text(idx_pid)
-
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
@@ -330,7 +335,28 @@ if __name__ == "__main__":
     # parser.add_argument("--only-cmo", dest="only_cmo", action="store_true",
     #                     help="Only index CMO into the indexing core. Does not swap afterwards.")
 
-    input_args: argparse.Namespace = parser.parse_args()
+    return parser
+
+
+def run(argv: Optional[list[str]] = None) -> None:
+    """
+    Command-line entrypoint. Parses the arguments, guards against concurrent runs
+    with a PID file, and exits with the status of the indexing run.
+
+    :param argv: Optional list of arguments; defaults to the ones given on the command line.
+    """
+    input_args: argparse.Namespace = build_parser().parse_args(argv)
+
+    faulthandler.enable()
+    _configure_logging()
+
+    idx_pid = str(os.getpid())
+    pid_file: Path = Path("/tmp", "muscatplus_indexer.pid")  # noqa: S108
+    if pid_file.exists():
+        log.critical("Process is already running. Exiting")
+        sys.exit(1)
+
+    pid_file.write_text(idx_pid)
 
     try:
         success: bool = main(input_args)
@@ -347,3 +373,7 @@ if __name__ == "__main__":
         sys.exit()
     # Exit with an error code.
     sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,6 @@
+import sys
+
+from index import run
+
+if __name__ == "__main__":
+    run(["--only-diamm", *sys.argv[1:]])
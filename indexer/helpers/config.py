@@ -0,0 +1,29 @@
+import functools
+import os
+
+import yaml
+
+# Use the libyaml bindings where they are available; the configuration files only
+# contain plain YAML, so the safe loader is all that is needed.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_config(filename: str) -> dict:
+    """
+    Loads and parses a YAML configuration file. Results are cached on the absolute path
+    and modification time of the file, so repeated loads of the same file only parse it
+    once, but an edited file is picked up again.
+
+    Callers must not modify the returned dictionary, since it is shared; take a
+    copy first if it needs to be changed.
+
+    :param filename: The path to a YAML file
+    :return: The parsed configuration
+    """
+    return _load_config(os.path.abspath(filename), os.stat(filename).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str, mtime_ns: int) -> dict:
+    with open(path) as cfg_file:
+        return yaml.load(cfg_file, Loader=_YAMLLoader)  # noqa: S506
@@ -1,7 +1,6 @@
 import datetime
 import functools
 import logging.config
-import math
 import re
 from typing import Optional, Pattern
 
@@ -21,6 +20,13 @@ SIMPLE_RANGE_REGEX: Pattern = re.compile(r"^(?P<first>\d{4})-(?P<second>\d{4})$"
 DOT_DIVIDED_REGEX: Pattern = re.compile(
     r"(\d{2}\.)?(\d{2})\.(\d{4})(-(\d{2}\.)?(\d{2})\.(\d{4}))?"
 )
+# Plain ISO 8601 dates and intervals, e.g., 1750-03-04 or 1750-03/1760. These are the most common shape
+# of statement by the time it reaches edtf, so they are handled directly.
+ISO_DATE_REGEX: Pattern = re.compile(
+    r"^(?P<first>\d{4})(?:-(?P<first_month>\d{2})(?:-(?P<first_day>\d{2}))?)?"
+    r"(?:/(?P<second>\d{4})(?:-(?P<second_month>\d{2})(?:-(?P<second_day>\d{2}))?)?)?$"
+)
+DAYS_IN_MONTH: tuple[int, ...] = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 CENTURY_REGEX: Pattern = re.compile(
     r"^(?P<century>\d{2})(?:th|st|rd) century, (?P<adjective1>\w+)(?: (?P<adjective2>\w+))?$",
     re.IGNORECASE,
@@ -40,83 +46,190 @@ MULTI_YEAR_REGEX: Pattern = re.compile(
 # A lot of dates have a letters attached to them for some odd reason.
 STRIP_LETTERS: Pattern = re.compile(r"(?P<year>\d{3,4})(?:c|p|q|a|!])")
 # Find any cases like "between XXXX and YYYY". Also handles French ('entre XXXX et YYYY') and german ('um XXXX bis um XXXX)
-EXPLICIT_BETWEEN: Pattern = re.compile(
-    r"^.*(?:between|entre|um|von|vor|et).*(?P<first>\d{4}).*(?P<second>\d{4}).*$",
-    re.IGNORECASE,
+# These are lookaheads so that every (possibly overlapping) starting position is found; see
+# _rewrite_explicit_between for how they are used.
+BETWEEN_KEYWORD_REGEX: Pattern = re.compile(
+    r"(?=(between|entre|um|von|vor|et))", re.IGNORECASE
 )
+FOUR_DIGITS_REGEX: Pattern = re.compile(r"(?=\d{4})")
+ANY_DIGIT_REGEX: Pattern = re.compile(r"\d")
 # Any ranges with explicitly named century periods in parens can be ignored too, e.g., "1750-1799 (18.2d)"
 # Also, any ones with just a single date can be ignored. We can combine these parenthetical statements into
 # a single regex statement afterwards.
 PARENTHETICAL_APPENDAGES1: Pattern = re.compile(r"(?P<year>\d{4}-\d{4})\s+\(.*\)")
 PARENTHETICAL_APPENDAGES2: Pattern = re.compile(r"(?P<year>\d{4})\s+\(.*\)")
-# Deal with years that have zeros or Xs as the day, e.g., 1999-10-00, 1999-10-XX
-ZERO_DAY_REGEX: Pattern = re.compile(r"^(?P<year>\d{4})-\d{2}-(00|XX)$")
-# Deal with dates that are mushed together, e.g., 19991010-19991020
-MUSHED_TOGETHER_REGEX: Pattern = re.compile(r"(?P<first>\d{4})\d{4}")
+# Deal with years that have zeros or Xs as the day, e.g., 1999-10-00, 1999-10-XX, and with dates that are
+# mushed together, e.g., 19991010-19991020. Both are reduced to their years in a single pass; only one
+# of the two groups takes part in any match, and the other is substituted as an empty string.
+ZERO_DAY_OR_MUSHED_REGEX: Pattern = re.compile(
+    r"^(?P<zero_day>\d{4})-\d{2}-(?:00|XX)$|(?P<mushed>\d{4})\d{4}"
+)
 MUSHED_TOGETHER_RANGE_REGEX: Pattern = re.compile(
     r"(?P<first>\d{4})\d{4}-(?P<second>\d{4})\d{4}"
 )
 
+# The number of parts a century is divided into for each period, e.g. "16th century, second half" or "18.2q"
+CENTURY_PERIOD_DIVIDERS: dict[str, int] = {
+    "half": 2,
+    "h": 2,
+    "third": 3,
+    "t": 3,
+    "quarter": 4,
+    "q": 4,
+    # interpret 'beginning' (n) and 'end' (x) as a decade, as in '18.ex' or '19.in'
+    "d": 10,
+    "n": 10,
+    "x": 10,
+    "c": 1,
+    "e": 1,
+}
+# Which of those parts is meant; 'beginning' (i) is treated as the first decade.
+CENTURY_ORDINAL_MULTIPLIERS: dict[str, int] = {
+    "first": 1,
+    "i": 1,
+    "second": 2,
+    "third": 3,
+    "fourth": 4,
+}
+# Ordinals that refer to the last part of the century, whatever the period.
+CENTURY_LAST_ORDINALS: frozenset[str] = frozenset({"last", "e", "s", "m"})
+# The start and end offsets into the century for each (divider, multiplier) pair, e.g. (4, 3) is the
+# third quarter, (50, 75).
+CENTURY_PERIOD_SPANS: dict[tuple[int, int], tuple[int, int]] = {
+    (divider, multiplier): (
+        (multiplier - 1) * (100 // divider),
+        multiplier * (100 // divider),
+    )
+    for divider in set(CENTURY_PERIOD_DIVIDERS.values())
+    for multiplier in range(1, divider + 1)
+}
+
 EARLY_CENTURY_END_YEAR: int = 10
 LATE_CENTURY_START_YEAR: int = 90
-
-NO_DATES = {
-    "[s.a.]",
-    "[s. a.]",
-    "s.a.",
-    "s/d",
-    "n/d",
-    "(s.d.)",
-    "[s.d.]",
-    "[s.d]",
-    "[s. d.]",
-    "s. d.",
-    "s.d.",
-    "[n.d.]",
-    "n. d.",
-    "n.d.",
-    "[n. d.]",
-    "[o.J]",
-    "o.J",
-    "o.J.",
-    "[s.n.]",
-    "(s. d.)",
-    "[s.l.]",
-    "[s.a]",
-    "xxxx-xxxx",
-    "uuuu-uuuu",
-    "?",
-    "??",
-    "[s..d]",
-    "s/f",
-    "[s.d. ]",
-    "[s,d,]",
-    "[s.t.]",
-    "[o. J.]",
-    "s.d",
-    "[s.d.}",
-    "o.d.",
-    "s.t.",
-    "[o.J.]",
-    "(n.d.)",
-    "[without]",
-    "[s .a.]",
-    "[s/d/]",
-    "[s.d.[",
-    "[s.c.]",
-    "s/ d",
-    "[?]",
-    "[s,d.]",
-    "[sd]",
-    "(s.d)",
-    "unk",
-    "unknown",
-    "[s. f.]",
-    "[s. n.]",
-    "[s. d,]",
-    "[sine anno]",
+# The start and end offsets into the century for each of the adjectives in '16th century, early'
+CENTURY_ADJECTIVE_SPANS: dict[str, tuple[int, int]] = {
+    "beginning": (0, EARLY_CENTURY_END_YEAR),
+    "start": (0, EARLY_CENTURY_END_YEAR),
+    "early": (0, EARLY_CENTURY_END_YEAR),
+    "late": (LATE_CENTURY_START_YEAR, 100),
+    "end": (LATE_CENTURY_START_YEAR, 100),
+    "middle": (25, 75),
 }
 
+# Statements that are known not to contain any date information.
+NO_DATES: frozenset[str] = frozenset(
+    {
+        "[s.a.]",
+        "[s. a.]",
+        "s.a.",
+        "s/d",
+        "n/d",
+        "(s.d.)",
+        "[s.d.]",
+        "[s.d]",
+        "[s. d.]",
+        "s. d.",
+        "s.d.",
+        "[n.d.]",
+        "n. d.",
+        "n.d.",
+        "[n. d.]",
+        "[o.J]",
+        "o.J",
+        "o.J.",
+        "[s.n.]",
+        "(s. d.)",
+        "[s.l.]",
+        "[s.a]",
+        "xxxx-xxxx",
+        "uuuu-uuuu",
+        "?",
+        "??",
+        "[s..d]",
+        "s/f",
+        "[s.d. ]",
+        "[s,d,]",
+        "[s.t.]",
+        "[o. J.]",
+        "s.d",
+        "[s.d.}",
+        "o.d.",
+        "s.t.",
+        "[o.J.]",
+        "(n.d.)",
+        "[without]",
+        "[s .a.]",
+        "[s/d/]",
+        "[s.d.[",
+        "[s.c.]",
+        "s/ d",
+        "[?]",
+        "[s,d.]",
+        "[sd]",
+        "(s.d)",
+        "unk",
+        "unknown",
+        "[s. f.]",
+        "[s. n.]",
+        "[s. d,]",
+        "[sine anno]",
+    }
+)
+# Spelling variants of 'sine anno', 'sine dato', 'no date' and 'ohne Jahr' that are not listed above,
+# e.g., '[S.D.]' or 's. n'.
+NO_DATES_VARIANTS_REGEX: Pattern = re.compile(
+    r"^\[?(?:s\.?\s?[adn]\.?|n\.?d\.?|o\.?J)\.?]?$", re.IGNORECASE
+)
+
+
+def _rewrite_explicit_between(statement: str) -> str:
+    """
+    Rewrites statements like 'between 1750 and 1760' to '1750/1760'.
+
+    This gives the same results as substituting the pattern
+    '^.*(?:between|...).*(?P<first>\\d{4}).*(?P<second>\\d{4}).*$', but in linear time; the
+    regex has three unbounded '.*' groups and backtracks badly on long statements that
+    don't match. Like that pattern, it takes the last four digits in the statement as the
+    second year, the last four digits before those as the first year, and requires one of
+    the keywords to appear before the first year. Statements that don't match are returned
+    unchanged.
+
+    :param statement: A date statement
+    :return: The rewritten statement
+    """
+    # '.' does not cross newlines, but '$' will match before a single trailing one. Rather than
+    # slicing that newline off, the searches are limited to the text before it.
+    end: int = len(statement)
+    if (newline_pos := statement.find("\n")) != -1:
+        if newline_pos != end - 1:
+            return statement
+        end = newline_pos
+
+    if not BETWEEN_KEYWORD_REGEX.search(statement, 0, end):
+        return statement
+
+    year_starts: list[int] = [
+        m.start() for m in FOUR_DIGITS_REGEX.finditer(statement, 0, end)
+    ]
+    if len(year_starts) < 2:
+        return statement
+
+    second: int = year_starts[-1]
+    first: Optional[int] = next(
+        (y for y in reversed(year_starts) if y <= second - 4), None
+    )
+    if first is None:
+        return statement
+
+    if not any(
+        m.end(1) <= first for m in BETWEEN_KEYWORD_REGEX.finditer(statement, 0, end)
+    ):
+        return statement
+
+    return (
+        f"{statement[first:first + 4]}/{statement[second:second + 4]}{statement[end:]}"
+    )
+
 
 def _parse_century_date_with_fraction(
     century_start: int, ordinal: str, period: str
@@ -134,50 +247,95 @@ def _parse_century_date_with_fraction(
     :param period: e.g. quarter
     :return: A tuple corresponding to the correct span of years.
     """
-    log.debug(
-        "Century start: %s, ordinal: %s, period: %s", century_start, ordinal, period
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Century start: %s, ordinal: %s, period: %s", century_start, ordinal, period
+        )
 
-    divider: int
-    if period in ("half", "h"):
-        divider = 2
-    elif period in ("third", "t"):
-        divider = 3
-    elif period in ("quarter", "q"):
-        divider = 4
-    # interpret 'beginning' (n) and 'end' (x) as a decade, as in '18.ex' or '19.in'
-    elif period in ("d", "n", "x"):
-        divider = 10
-    elif period in ("c", "e"):
-        divider = 1
-    else:
+    divider: Optional[int] = CENTURY_PERIOD_DIVIDERS.get(period)
+    if divider is None:
         log.debug("Unknown period %s when parsing century date", period)
         return None
 
     multiplier: int
     if ordinal.isdigit():
         multiplier = int(ordinal)
-    # if the beginning, treat it as the first decade
-    elif ordinal in ("first", "i"):
-        multiplier = 1
-    elif ordinal == "second":
-        multiplier = 2
-    elif ordinal == "third":
-        multiplier = 3
-    elif ordinal == "fourth":
-        multiplier = 4
+    elif ordinal in CENTURY_ORDINAL_MULTIPLIERS:
+        multiplier = CENTURY_ORDINAL_MULTIPLIERS[ordinal]
     # if the ending, treat it as the last decade
-    elif ordinal in ("last", "e", "s", "m"):
+    elif ordinal in CENTURY_LAST_ORDINALS:
         multiplier = divider
     else:
         log.debug("Unknown ordinal %s when parsing century date", ordinal)
         return None
 
-    period_years: int = math.floor(100 / divider)
-    return century_start + ((multiplier - 1) * period_years), century_start + (
-        multiplier * period_years
+    span: Optional[tuple[int, int]] = CENTURY_PERIOD_SPANS.get((divider, multiplier))
+    if span is None:
+        # Numbered periods past the end of the century, e.g. '18.5q'
+        period_years: int = 100 // divider
+        span = (multiplier - 1) * period_years, multiplier * period_years
+
+    return century_start + span[0], century_start + span[1]
+
+
+def _is_valid_iso_date(year: int, month: Optional[str], day: Optional[str]) -> bool:
+    if month is None:
+        return True
+
+    month_num: int = int(month)
+    if not 1 <= month_num <= 12:
+        return False
+
+    if day is None:
+        return True
+
+    days: int = DAYS_IN_MONTH[month_num - 1]
+    if month_num == 2 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        days = 28
+
+    return 1 <= int(day) <= days
+
+
+def _parse_iso_date(iso_match: re.Match) -> Optional[tuple[int, int]]:
+    """
+    Parse a plain ISO 8601 date or interval (years, optionally with months and days) without
+    going through edtf. Returns None for anything edtf needs to look at, i.e., invalid
+    months or days, reversed intervals, and the 0 / 9999 years that edtf uses as
+    placeholders for unknown dates.
+
+    :param iso_match: A match of ISO_DATE_REGEX
+    :return: A tuple of the start and end years, or None
+    """
+    first: int = int(iso_match.group("first"))
+    second: int = (
+        int(second_year) if (second_year := iso_match.group("second")) else first
     )
 
+    if first == 0 or second == 9999 or first > second:
+        return None
+
+    if not _is_valid_iso_date(
+        first, iso_match.group("first_month"), iso_match.group("first_day")
+    ) or not _is_valid_iso_date(
+        second, iso_match.group("second_month"), iso_match.group("second_day")
+    ):
+        return None
+
+    return first, second
+
+
+def _try_iso(date_statement: str) -> Optional[tuple[int, int]]:
+    """
+    Parse a date statement that is a plain ISO 8601 date or interval.
+
+    :param date_statement: A date statement
+    :return: A tuple of the start and end years, or None if edtf needs to look at it
+    """
+    if iso_match := ISO_DATE_REGEX.match(date_statement):
+        return _parse_iso_date(iso_match)
+
+    return None
+
 
 def _parse_century_date_with_adjective(
     century_start: int, adjective: str
@@ -188,17 +346,14 @@ def _parse_century_date_with_adjective(
     :param adjective: e.g. early
     :return:
     """
-    if adjective in ("beginning", "start", "early"):
-        return century_start, century_start + EARLY_CENTURY_END_YEAR
-    if adjective in ("late", "end"):
-        return century_start + LATE_CENTURY_START_YEAR, century_start + 100
-    if adjective == "middle":
-        return century_start + 25, century_start + 75
+    span: Optional[tuple[int, int]] = CENTURY_ADJECTIVE_SPANS.get(adjective)
+    if span is None:
+        return None
 
-    return None
+    return century_start + span[0], century_start + span[1]
 
 
-@functools.lru_cache(maxsize=2048)
+@functools.lru_cache(maxsize=131072)
 def parse_date_statement(date_statement: str) -> tuple[Optional[int], Optional[int]]:  # noqa: MC0001
     # Optimize for non-date years; return as early as possible if we know we can't get any further information.
     if not date_statement or date_statement in NO_DATES:
@@ -228,59 +383,75 @@ def parse_date_statement(date_statement: str) -> tuple[Optional[int], Optional[i
 
         return first, second
 
+    # Fast path: None of the simplification steps below change a valid ISO date or interval,
+    # so these can be parsed directly as well.
+    if iso_date := _try_iso(date_statement):
+        return iso_date
+
+    # None of the rewrites below will find a date in these, and edtf is slow to reject them.
+    if NO_DATES_VARIANTS_REGEX.match(date_statement):
+        return None, None
+
     # Slow path
     # First simplify known problems for the edtf parser
     simplified_date_statement = date_statement.replace("(?)", "")
 
     # Replace any dates that use dots instead of dashes to separate the parameters.
-    if DOT_DIVIDED_REGEX.match(simplified_date_statement):
+    if "." in simplified_date_statement and DOT_DIVIDED_REGEX.match(
+        simplified_date_statement
+    ):
         simplified_date_statement = simplified_date_statement.replace(".", "-")
 
-    simplified_date_statement = re.sub(r"[?\[\]]", r"", simplified_date_statement)
-    simplified_date_statement = re.sub(
-        STRIP_LETTERS, r"\g<year>", simplified_date_statement
+    # Drop any question marks and square brackets.
+    simplified_date_statement = (
+        simplified_date_statement.replace("?", "").replace("[", "").replace("]", "")
     )
-    simplified_date_statement = re.sub(
-        ZERO_DAY_REGEX, r"\g<year>", simplified_date_statement
+    simplified_date_statement = STRIP_LETTERS.sub(
+        r"\g<year>", simplified_date_statement
     )
-    simplified_date_statement = re.sub(
-        MUSHED_TOGETHER_REGEX, r"\g<first>", simplified_date_statement
+    simplified_date_statement = ZERO_DAY_OR_MUSHED_REGEX.sub(
+        r"\g<zero_day>\g<mushed>", simplified_date_statement
     )
-    simplified_date_statement = re.sub(
-        MULTI_YEAR_REGEX, r"\g<first>/\g<second>", simplified_date_statement
+    simplified_date_statement = MULTI_YEAR_REGEX.sub(
+        r"\g<first>/\g<second>", simplified_date_statement
     )
-    simplified_date_statement = re.sub(
-        EXPLICIT_BETWEEN, r"\g<first>/\g<second>", simplified_date_statement
+    simplified_date_statement = _rewrite_explicit_between(simplified_date_statement)
+    simplified_date_statement = MUSHED_TOGETHER_RANGE_REGEX.sub(
+        r"\g<first>/\g<second>", simplified_date_statement
     )
-    simplified_date_statement = re.sub(
-        MUSHED_TOGETHER_RANGE_REGEX, r"\g<first>/\g<second>", simplified_date_statement
-    )
-    simplified_date_statement = re.sub(
-        PARENTHETICAL_APPENDAGES1, r"\g<year>", simplified_date_statement
-    )
-    simplified_date_statement = re.sub(
-        PARENTHETICAL_APPENDAGES2, r"\g<year>", simplified_date_statement
-    )
-    # Any remaining parenthesis should be dropped from anywhere in the string
-    simplified_date_statement = re.sub(r"([()])", "", simplified_date_statement)
+    # The last three rewrites only deal with parentheses, so most statements can skip them entirely.
+    if "(" in simplified_date_statement or ")" in simplified_date_statement:
+        simplified_date_statement = PARENTHETICAL_APPENDAGES1.sub(
+            r"\g<year>", simplified_date_statement
+        )
+        simplified_date_statement = PARENTHETICAL_APPENDAGES2.sub(
+            r"\g<year>", simplified_date_statement
+        )
+        # Any remaining parenthesis should be dropped from anywhere in the string
+        simplified_date_statement = (
+            simplified_date_statement.replace("(", "").replace(")", "")
+        )
     # Strip any leading or trailing quotation marks.
-    simplified_date_statement = simplified_date_statement.lstrip('"').rstrip('"')
-    simplified_date_statement = simplified_date_statement.replace(
-        "not after", "before"
-    ).replace("not before", "after")
+    simplified_date_statement = simplified_date_statement.strip('"')
+    if "not " in simplified_date_statement:
+        simplified_date_statement = simplified_date_statement.replace(
+            "not after", "before"
+        ).replace("not before", "after")
     simplified_date_statement = simplified_date_statement.strip()
-    log.debug("Parsing %s simplified to %s", date_statement, simplified_date_statement)
+    # This runs for every statement that gets this far, so skip the call when it won't be logged.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Parsing %s simplified to %s", date_statement, simplified_date_statement
+        )
 
     # adds / subtracts 99 years if a person's birth or death dates are the only known dates
-    if simplified_date_statement.endswith("*") or simplified_date_statement.endswith(
-        "+"
-    ):
+    if simplified_date_statement.endswith(("*", "+")):
         year_section: str = simplified_date_statement[:4]
         if year_section.isdigit():
-            if simplified_date_statement.endswith("*"):
-                return int(year_section), int(year_section) + 99
-            elif simplified_date_statement.endswith("+"):
-                return int(year_section) - 99, int(year_section)
+            life_year: int = int(year_section)
+            if simplified_date_statement[-1] == "*":
+                return life_year, life_year + 99
+            return life_year - 99, life_year
 
     # handles 17-- or 17?? case
     dashes_match = CENTURY_DASHES_REGEX.match(simplified_date_statement)
@@ -300,13 +471,20 @@ def parse_date_statement(date_statement: str) -> tuple[Optional[int], Optional[i
     if simplified_date_statement.isdigit():
         return int(simplified_date_statement), int(simplified_date_statement)
 
+    # Plain ISO dates don't need the full edtf grammar.
+    if iso_date := _try_iso(simplified_date_statement):
+        return iso_date
+
     # edtf doesn't support advanced century parsing - it interprets '15th century, early' as [1400-1499]
     # we try our own basic parsing for the most common cases
-    century_match = CENTURY_REGEX.fullmatch(simplified_date_statement)
-    # Try again with another style
-    if not century_match:
-        log.debug("First century did not match; trying another.")
-        century_match = ANOTHER_CENTURY_REGEX.fullmatch(simplified_date_statement)
+    # The two styles can be told apart by the character after the century number ('18th
+    # century, ...' vs. '18.2q'), so only one of them needs to be tried.
+    century_regex: Pattern = (
+        ANOTHER_CENTURY_REGEX
+        if simplified_date_statement[2:3] == "."
+        else CENTURY_REGEX
+    )
+    century_match = century_regex.fullmatch(simplified_date_statement)
 
     if century_match:
         # Match the century (18), subtract 1 (17), and multiply by 100 (1700)
@@ -325,6 +503,11 @@ def parse_date_statement(date_statement: str) -> tuple[Optional[int], Optional[i
     else:
         log.debug("Neither century regexes matched for %s", simplified_date_statement)
 
+    # Neither edtf parser will find a year in a statement without any digits, and the natural
+    # language one is very slow to fail on them.
+    if not ANY_DIGIT_REGEX.search(simplified_date_statement):
+        return None, None
+
     parsed_date = None
     # First try the strictest processing
     try:
@@ -437,21 +620,21 @@ def parse_date_metadata(
         else:
             # We don't know which of the date statements is the start or end, and sometimes they're ranges
             # so we just take the earliest start and latest end
-            date_ranges_from_date_statements = [
-                parse_date_statement(d) for d in date_statements
-            ]
-            start_years = [
-                start
-                for start, _ in date_ranges_from_date_statements
-                if start is not None
-            ]
-            end_years = [
-                end for _, end in date_ranges_from_date_statements if end is not None
-            ]
-            if start_years:
-                start_year = min(start_years)
-            if end_years:
-                end_year = max(end_years)
+            earliest_start: Optional[int] = None
+            latest_end: Optional[int] = None
+            for d in date_statements:
+                start, end = parse_date_statement(d)
+                if start is not None and (
+                    earliest_start is None or start < earliest_start
+                ):
+                    earliest_start = start
+                if end is not None and (latest_end is None or end > latest_end):
+                    latest_end = end
+
+            if earliest_start is not None:
+                start_year = earliest_start
+            if latest_end is not None:
+                end_year = latest_end
 
     if start_year is not None and end_year is not None and start_year > end_year:
         log.warning(
@@ -469,8 +652,9 @@ LATEST_YEAR_IF_MISSING: int = datetime.datetime.now().year
 def process_date_statements(
     date_statements: list[str], record_id: str
 ) -> Optional[list[int]]:
-    earliest_dates: list[int] = []
-    latest_dates: list[int] = []
+    # The earliest and latest years seen across all the statements, folded as we go.
+    min_earliest: Optional[int] = None
+    max_latest: Optional[int] = None
 
     for statement in date_statements:
         if not statement or statement in NO_DATES:
@@ -494,11 +678,11 @@ def process_date_statements(
             )
             return None
 
-        if earliest:
-            earliest_dates.append(earliest)
+        if earliest and (min_earliest is None or earliest < min_earliest):
+            min_earliest = earliest
 
-        if latest:
-            latest_dates.append(latest)
+        if latest and (max_latest is None or latest > max_latest):
+            max_latest = latest
 
     # To prevent things like 18,345 AD, choose the min value of the latest
     # date and the current year (which is what we set it to if it's missing).
@@ -506,13 +690,13 @@ def process_date_statements(
     # discovered in the source, then choose the max value between that and
     # the earliest.
     earliest_date: int = (
-        max(min(earliest_dates), EARLIEST_YEAR_IF_MISSING)
-        if earliest_dates
+        max(min_earliest, EARLIEST_YEAR_IF_MISSING)
+        if min_earliest is not None
         else EARLIEST_YEAR_IF_MISSING
     )
     latest_date: int = (
-        min(max(latest_dates), LATEST_YEAR_IF_MISSING)
-        if latest_dates
+        min(max_latest, LATEST_YEAR_IF_MISSING)
+        if max_latest is not None
         else LATEST_YEAR_IF_MISSING
     )
 
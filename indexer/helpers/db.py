@@ -1,31 +1,43 @@
+import functools
 import logging
 
 import MySQLdb
-import yaml
 from dbutils.pooled_db import PooledDB
 from MySQLdb.cursors import SSDictCursor
 
-log = logging.getLogger("muscat_indexer")
-idx_config: dict = yaml.full_load(open("index_config.yml"))  # noqa: SIM115
+from indexer.helpers.config import load_config
 
-config: dict = {
-    "user": idx_config["mysql"]["username"],
-    "password": idx_config["mysql"]["password"],
-    "db": idx_config["mysql"]["database"],
-    "host": idx_config["mysql"]["server"],
-}
+log = logging.getLogger("muscat_indexer")
 
 
-mysql_connection = MySQLdb.connect(**config, cursorclass=SSDictCursor)
+@functools.cache
+def get_mysql_pool() -> PooledDB:
+    """
+    Returns the shared MySQL connection pool. It is created the first time it is
+    needed, rather than when this module is imported.
+    """
+    mysql_config: dict = load_config("index_config.yml")["mysql"]
+    config: dict = {
+        "user": mysql_config["username"],
+        "password": mysql_config["password"],
+        "db": mysql_config["database"],
+        "host": mysql_config["server"],
+    }
 
-mysql_pool = PooledDB(
-    **config,
-    creator=MySQLdb,
-    cursorclass=SSDictCursor,
-    maxconnections=6,
-    charset="utf8mb4",
-    use_unicode=True,
-)
+    # Open a connection up front and keep idle ones around, so that the indexers don't
+    # pay for a new handshake each time they check one out. When all the connections are
+    # in use, wait for one to be returned rather than raising an error.
+    return PooledDB(
+        **config,
+        creator=MySQLdb,
+        cursorclass=SSDictCursor,
+        mincached=mysql_config.get("mincached", 1),
+        maxcached=mysql_config.get("maxcached", 6),
+        maxconnections=mysql_config.get("maxconnections", 6),
+        blocking=True,
+        charset="utf8mb4",
+        use_unicode=True,
+    )
 
 
 def run_preflight_queries(cfg: dict) -> bool:
@@ -33,16 +45,20 @@ def run_preflight_queries(cfg: dict) -> bool:
     that sometimes pop up with Muscat.
     """
     log.info("Running preflight queries.")
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     dbname: str = cfg["mysql"]["database"]
 
-    # work around a bug with collations.
-    curs.execute(
-        f"""alter table {dbname}.holdings
-            modify lib_siglum varchar(32) collate utf8mb4_0900_as_cs null;
-            alter table {dbname}.sources
-            modify lib_siglum varchar(32) collate utf8mb4_0900_as_cs null;"""
-    )
+    # work around a bug with collations. MySQLdb does not run multiple statements in a
+    # single call, so alter each table separately.
+    try:
+        for table in ("holdings", "sources"):
+            curs.execute(
+                f"""alter table {dbname}.{table}
+                    modify lib_siglum varchar(32) collate utf8mb4_0900_as_cs null;"""
+            )
+    finally:
+        curs.close()
+        conn.close()
 
     return True
@@ -1,5 +1,5 @@
+import functools
 import re
-from enum import IntEnum, unique
 from typing import Optional
 
 
@@ -9,8 +9,9 @@ class ProjectIdentifiers:
     RISM = "rism"
 
 
-@unique
-class RecordTypes(IntEnum):
+# Plain integer constants rather than an IntEnum, since these are compared against the record
+# type ids from the database for every record, and enum member lookups are comparatively slow.
+class RecordTypes:
     UNSPECIFIED = 0
     COLLECTION = 1
     SOURCE = 2
@@ -26,96 +27,114 @@ class RecordTypes(IntEnum):
     WORK = 99  # Special case, so we can index record types within Incipits
 
 
-def get_record_type(record_type_id: int, is_single_item: bool) -> str:
-    if (
-        record_type_id
-        in (
-            RecordTypes.SOURCE,
-            RecordTypes.EDITION,
-            RecordTypes.THEORETICA_EDITION,
-            RecordTypes.LIBRETTO_EDITION,
-        )
-        and is_single_item is True
-    ):
-        return "single_item"
-    elif record_type_id in (
+# Sets of record types used to classify sources. These are built once, rather than on every call.
+SINGLE_ITEM_RECORD_TYPES: frozenset[int] = frozenset(
+    {
+        RecordTypes.SOURCE,
+        RecordTypes.EDITION,
+        RecordTypes.THEORETICA_EDITION,
+        RecordTypes.LIBRETTO_EDITION,
+    }
+)
+COLLECTION_RECORD_TYPES: frozenset[int] = frozenset(
+    {
         RecordTypes.COLLECTION,
         RecordTypes.EDITION,
         RecordTypes.LIBRETTO_EDITION,
         RecordTypes.THEORETICA_EDITION,
-    ):
-        return "collection"
-    elif record_type_id == RecordTypes.COMPOSITE_VOLUME:
-        return "composite"
-    elif record_type_id == RecordTypes.WORK:
-        return "work"
-    else:
-        return "item"
-
-
-def get_source_type(record_type_id: int) -> str:
-    if record_type_id in (
+    }
+)
+PRINTED_RECORD_TYPES: frozenset[int] = frozenset(
+    {
         RecordTypes.EDITION,
         RecordTypes.EDITION_CONTENT,
         RecordTypes.LIBRETTO_EDITION,
         RecordTypes.THEORETICA_EDITION,
         RecordTypes.LIBRETTO_EDITION_CONTENT,
         RecordTypes.THEORETICA_EDITION_CONTENT,
-    ):
-        return "printed"
-    elif record_type_id in (
+    }
+)
+MANUSCRIPT_RECORD_TYPES: frozenset[int] = frozenset(
+    {
         RecordTypes.COLLECTION,
         RecordTypes.SOURCE,
         RecordTypes.LIBRETTO_SOURCE,
         RecordTypes.THEORETICA_SOURCE,
-    ):
-        return "manuscript"
-    elif record_type_id == RecordTypes.COMPOSITE_VOLUME:
-        return "composite"
-    elif record_type_id == RecordTypes.WORK:
-        return "work"
-    else:
-        return "unspecified"
+    }
+)
+CONTENTS_RECORD_TYPES: frozenset[int] = frozenset(
+    {
+        RecordTypes.EDITION_CONTENT,
+        RecordTypes.LIBRETTO_EDITION_CONTENT,
+        RecordTypes.THEORETICA_EDITION_CONTENT,
+    }
+)
+# Only contents records if they have a parent
+POSSIBLE_CONTENTS_RECORD_TYPES: frozenset[int] = frozenset(
+    {
+        RecordTypes.SOURCE,
+        RecordTypes.LIBRETTO_SOURCE,
+        RecordTypes.THEORETICA_SOURCE,
+    }
+)
+# Only collection records if they have children
+POSSIBLE_COLLECTION_RECORD_TYPES: frozenset[int] = frozenset(
+    {
+        RecordTypes.COLLECTION,
+        RecordTypes.LIBRETTO_SOURCE,
+        RecordTypes.LIBRETTO_EDITION,
+        RecordTypes.THEORETICA_SOURCE,
+        RecordTypes.THEORETICA_EDITION,
+    }
+)
+
+
+# Labels for each record type id, looked up directly rather than tested against each set in turn.
+# Record types that are single items are handled separately, since they depend on the record.
+RECORD_TYPE_LABELS: dict[int, str] = {
+    **dict.fromkeys(COLLECTION_RECORD_TYPES, "collection"),
+    RecordTypes.COMPOSITE_VOLUME: "composite",
+    RecordTypes.WORK: "work",
+}
+SOURCE_TYPE_LABELS: dict[int, str] = {
+    **dict.fromkeys(MANUSCRIPT_RECORD_TYPES, "manuscript"),
+    **dict.fromkeys(PRINTED_RECORD_TYPES, "printed"),
+    RecordTypes.COMPOSITE_VOLUME: "composite",
+    RecordTypes.WORK: "work",
+}
+
+
+def get_record_type(record_type_id: int, is_single_item: bool) -> str:
+    if is_single_item is True and record_type_id in SINGLE_ITEM_RECORD_TYPES:
+        return "single_item"
+
+    return RECORD_TYPE_LABELS.get(record_type_id, "item")
+
+
+def get_source_type(record_type_id: int) -> str:
+    return SOURCE_TYPE_LABELS.get(record_type_id, "unspecified")
 
 
 def get_is_contents_record(record_type_id: int, parent_id: Optional[int]) -> bool:
     return bool(
-        record_type_id
-        in (
-            RecordTypes.EDITION_CONTENT,
-            RecordTypes.LIBRETTO_EDITION_CONTENT,
-            RecordTypes.THEORETICA_EDITION_CONTENT,
-        )
-        or record_type_id
-        in (
-            RecordTypes.SOURCE,
-            RecordTypes.LIBRETTO_SOURCE,
-            RecordTypes.THEORETICA_SOURCE,
-        )
+        record_type_id in CONTENTS_RECORD_TYPES
+        or record_type_id in POSSIBLE_CONTENTS_RECORD_TYPES
         and parent_id is not None
     )
 
 
 def get_is_collection_record(record_type_id: int, children_count: int) -> bool:
     return bool(
-        record_type_id
-        in (
-            RecordTypes.COLLECTION,
-            RecordTypes.LIBRETTO_SOURCE,
-            RecordTypes.LIBRETTO_EDITION,
-            RecordTypes.THEORETICA_SOURCE,
-            RecordTypes.THEORETICA_EDITION,
-        )
-        and children_count > 0
+        record_type_id in POSSIBLE_COLLECTION_RECORD_TYPES and children_count > 0
     )
 
 
+# There are a few thousand library sigla, but this is called for every record that has one.
+@functools.lru_cache(maxsize=16384)
 def country_code_from_siglum(siglum: str) -> str:
     # split the country code from the rest of the siglum, and return that.
-    # If there was a problem splitting the siglum because it was malformed,
-    # return it wholescale and keep going.
-    split_sig = siglum.split("-")
-    return split_sig[0] if len(split_sig) > 0 else siglum
+    # If the siglum is malformed and has no separator, this returns it wholescale.
+    return siglum.partition("-")[0]
 
 
 COUNTRY_CODE_MAPPING = {
@@ -340,7 +359,15 @@ ISO3166_TO_SIGLUM_MAPPING = {
     "XE-PG": "PNG",
 }
 
-RISM_ID_SUB: re.Pattern = re.compile(r"(?:people|sources|institutions)/(?P<doc_id>\d+)")
+RISM_ID_SUB: re.Pattern = re.compile(
+    r"(?P<kind>people|sources|institutions)/(?P<doc_id>\d+)"
+)
+# Solr ID prefixes for each kind of RISM ID
+RISM_ID_PREFIXES: dict[str, str] = {
+    "people": "person",
+    "sources": "source",
+    "institutions": "institution",
+}
 
 
 def transform_rism_id(q_id: Optional[str]) -> Optional[str]:
@@ -352,16 +379,8 @@ def transform_rism_id(q_id: Optional[str]) -> Optional[str]:
     if not q_id:
         return None
 
-    doc_matcher: Optional[re.Match[str]] = re.match(RISM_ID_SUB, q_id)
+    doc_matcher: Optional[re.Match[str]] = RISM_ID_SUB.match(q_id)
     if not doc_matcher:
         return None
 
-    doc_num: str = doc_matcher["doc_id"]
-    if "people" in q_id:
-        return f"person_{doc_num}"
-    elif "sources" in q_id:
-        return f"source_{doc_num}"
-    elif "institutions" in q_id:
-        return f"institution_{doc_num}"
-    else:
-        return None
+    return f"{RISM_ID_PREFIXES[doc_matcher['kind']]}_{doc_matcher['doc_id']}"
@@ -1,28 +1,66 @@
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 import pymarc
 
+# Control fields are those in the <010 range. Tags are compared as strings, so this also covers
+# the shorter tags on truncated lines, e.g. '=05', that int() would have read as below 10.
+CONTROL_TAGS: frozenset[str] = frozenset(
+    tag for width in (1, 2, 3) for tag in (f"{i:0{width}d}" for i in range(10))
+)
+
 
 def _parse_field(line: str) -> pymarc.Field:
     # General format: =TAG  ##$afoo$bbar
     tag_value: str = line[1:4]
 
-    # Control fields are those in the <010 range. They do not have
-    # subfields, but have the data encoded in them directly.
-    control: bool = tag_value.isdigit() and int(tag_value) < 10
-    if control:
+    # Control fields do not have subfields, but have the data encoded in them directly.
+    if tag_value in CONTROL_TAGS:
         return pymarc.Field(tag=tag_value, data=line[6:].rstrip("\r\n"))
 
     indicators: pymarc.Indicators = pymarc.Indicators(line[6], line[7])
-    sub_value: str = line[9:]
-    subf_list: list = sub_value.split("$") if sub_value else []
-    subfields: list[pymarc.Subfield] = [
-        _parse_subf(itm) for itm in subf_list if itm != ""
-    ]
-    return pymarc.Field(tag=tag_value, indicators=indicators, subfields=subfields)
+    subf_values: str = line[9:]
+    # Escaped dollar signs are rare, so check for them once per field rather than once per
+    # subfield. The escape contains no '$', so it never spans two subfields.
+    parse_subf: Callable[[str], pymarc.Subfield] = (
+        _parse_escaped_subf if "_DOLLAR_" in subf_values else _parse_subf
+    )
+    # Splitting on '$' leaves an empty string before the first subfield, and for any empty subfields;
+    # an empty value just splits into a single empty string.
+    subfields: list[pymarc.Subfield] = list(
+        map(parse_subf, filter(None, subf_values.split("$")))
+    )
+    return _new_data_field(tag_value, indicators, subfields)
+
+
+_new_field = pymarc.Field.__new__
+
+
+def _new_data_field(
+    tag: str, indicators: pymarc.Indicators, subfields: list[pymarc.Subfield]
+) -> pymarc.Field:
+    """
+    Creates a non-control field without going through pymarc.Field.__init__, which checks
+    the tag again and copies the indicators. Any line that has indicators also has a full
+    three-character tag, and for those the constructor sets exactly these attributes, so
+    the result is the same field. This depends on the internals of the pinned pymarc
+    revision, and needs checking again when pymarc is upgraded.
+    """
+    field: pymarc.Field = _new_field(pymarc.Field)
+    field.tag = tag
+    field.data = None
+    field._indicators = indicators
+    field.subfields = subfields
+    field.control_field = False
+
+    return field
 
 
 def _parse_subf(subf_value: str) -> pymarc.Subfield:
+    return pymarc.Subfield(subf_value[0], subf_value[1:].strip())
+
+
+def _parse_escaped_subf(subf_value: str) -> pymarc.Subfield:
     code: str = subf_value[0]
     value: str = subf_value[1:].strip()
 
@@ -32,16 +70,21 @@ def _parse_subf(subf_value: str) -> pymarc.Subfield:
     return pymarc.Subfield(code, value)
 
 
+# Parent and related records are parsed again for every source or holding that refers to
+# them, so keep the most recent ones around.
+@functools.lru_cache(maxsize=512)
 def create_marc(record: str) -> pymarc.Record:
     """
     Creates a pymarc Record from the data stored in Muscat.
 
+    Records are cached on their raw data, so the same Record instance may be returned to
+    several callers; they must not be modified.
+
     :param record: A raw marc_source record from Muscat
     :return: an instance of a pymarc.Record
     """
-    lines: list = record.split("\n")
     fields: list[pymarc.Field] = [
-        _parse_field(line) for line in lines if line and line != ""
+        _parse_field(line) for line in record.split("\n") if line
     ]
     p_record: pymarc.Record = pymarc.Record(fields=fields)
     # p_record.add_field(*fields)
@@ -56,8 +99,14 @@ def create_marc_list(marc_records: Optional[str]) -> list[pymarc.Record]:
     :param marc_records: A string of newline-separated MARC records
     :return: A list of pymarc.Record objects
     """
-    return (
-        [create_marc(rec.strip()) for rec in marc_records.split("\n") if rec]
-        if marc_records
-        else []
-    )
+    if not marc_records:
+        return []
+
+    # The records are joined with newlines, which also separate the fields of each record, so every
+    # line becomes a record of its own. They have already been split into lines here, so build them
+    # directly rather than splitting each one again in create_marc.
+    return [
+        pymarc.Record(fields=[_parse_field(line)] if (line := rec.strip()) else [])
+        for rec in marc_records.split("\n")
+        if rec
+    ]
@@ -16,133 +16,198 @@ from indexer.helpers.utilities import (
 
 log = logging.getLogger("muscat_indexer")
 
+# Separates the paragraphs of a note field that is configured to be split on breaks.
+BREAK_MARKER = "{{brk}}"
+
+# Returned by a compiled field function when nothing should be added to the document
+# for that field. A sentinel is used since a static value may legitimately be None.
+_SKIP = object()
+
+FieldFunction = Callable[[pymarc.Record, str], Any]
+
+# Compiled profiles, keyed on the identities of the profile and processor module. Both
+# are loaded once at module level by the record modules, so they live as long as the
+# process does.
+_COMPILED_PROFILES: dict[tuple[int, int], list[tuple[str, FieldFunction]]] = {}
+
 
 def process_marc_profile(
     cfg: dict, doc_id: str, marc: pymarc.Record, processors: types.ModuleType
 ) -> dict:
-    solr_document: dict = {}
-
-    for solr_field, field_config in cfg.items():
-        multiple: bool = field_config.get("multiple", False)
-        required: bool = field_config.get("required", False)
-
-        if "value" in field_config:
-            # If we have a static value, simply set the field to the static value
-            # and move on.
-            solr_document[solr_field] = field_config["value"]
-        elif "processor" in field_config:
-            # a processor function is configured for this field.
-            to_json: bool = field_config.get("json", False)
-            fn_name: str = field_config["processor"]
-            fn_exists: bool = hasattr(processors, fn_name)
-
-            if not fn_exists:
-                log.warning(
-                    "Could not process Solr field %s for record %s; %s is a function that does not exist.",
-                    solr_field,
-                    doc_id,
-                    fn_name,
-                )
-                continue
-
-            processor_fn: Callable = getattr(processors, fn_name)
-            field_result: Any = processor_fn(marc)
-
-            # don't bother to add this to the result, since it would
-            # get stripped out anyway.
-            if field_result is None:
-                if required is True:
-                    log.critical(
-                        "%s requires a value, but one was not found for %s. Skipping this field.",
-                        solr_field,
-                        doc_id,
-                    )
-
-                continue
-
-            if to_json:
-                field_result = orjson.dumps(field_result).decode("utf-8")
-
-            solr_document[solr_field] = field_result
-        else:
-            breaks: bool = field_config.get("breaks", False)
-            links: bool = field_config.get("links", False)
-            # Values are True, False, and None. Default is None.
-            grouping: Optional[bool] = field_config.get("grouping")
-            sortout: bool = field_config.get("sorted", True)
-
-            # these will explode if the configuration is not correct.
-            marc_field = field_config["field"]
-            marc_subfield = field_config["subfield"]
-
-            if required and multiple:
-                processor_fn = to_solr_multi_required
-            elif not required and multiple:
-                processor_fn = to_solr_multi
-            elif required and not multiple:
-                processor_fn = to_solr_single_required
-            else:
-                # not required and not multiple, default.
-                processor_fn = to_solr_single
-
-            # This will raise an error if the processors encounter unexpected data.
-            try:
-                field_result = processor_fn(
-                    marc, marc_field, marc_subfield, grouping, sortout
-                )
-            except RequiredFieldException:
+    return {
+        solr_field: field_result
+        for solr_field, field_fn in _get_compiled_profile(cfg, processors)
+        if (field_result := field_fn(marc, doc_id)) is not _SKIP
+    }
+
+
+def _get_compiled_profile(
+    cfg: dict, processors: types.ModuleType
+) -> list[tuple[str, FieldFunction]]:
+    key: tuple[int, int] = (id(cfg), id(processors))
+    compiled: Optional[list[tuple[str, FieldFunction]]] = _COMPILED_PROFILES.get(key)
+
+    if compiled is None:
+        compiled = [
+            (solr_field, _compile_field(solr_field, field_config, processors))
+            for solr_field, field_config in cfg.items()
+        ]
+        _COMPILED_PROFILES[key] = compiled
+
+    return compiled
+
+
+def _compile_field(
+    solr_field: str, field_config: dict, processors: types.ModuleType
+) -> FieldFunction:
+    """
+    Resolves everything about a profile field that does not depend on the record being
+    indexed, and returns a function that takes a MARC record and its ID and returns the
+    value for the field, or _SKIP if the field should not be added to the document.
+    """
+    multiple: bool = field_config.get("multiple", False)
+    required: bool = field_config.get("required", False)
+
+    if "value" in field_config:
+        # If we have a static value, simply set the field to the static value
+        # and move on.
+        return _compile_static_field(field_config["value"])
+    elif "processor" in field_config:
+        return _compile_processor_field(solr_field, field_config, required, processors)
+
+    return _compile_marc_field(solr_field, field_config, required, multiple)
+
+
+def _compile_static_field(value: Any) -> FieldFunction:
+    def field_fn(marc: pymarc.Record, doc_id: str) -> Any:
+        return value
+
+    return field_fn
+
+
+def _compile_processor_field(
+    solr_field: str, field_config: dict, required: bool, processors: types.ModuleType
+) -> FieldFunction:
+    # a processor function is configured for this field.
+    to_json: bool = field_config.get("json", False)
+    fn_name: str = field_config["processor"]
+
+    if not hasattr(processors, fn_name):
+
+        def missing_fn(marc: pymarc.Record, doc_id: str) -> Any:
+            log.warning(
+                "Could not process Solr field %s for record %s; %s is a function that does not exist.",
+                solr_field,
+                doc_id,
+                fn_name,
+            )
+            return _SKIP
+
+        return missing_fn
+
+    processor_fn: Callable = getattr(processors, fn_name)
+
+    def field_fn(marc: pymarc.Record, doc_id: str) -> Any:
+        field_result: Any = processor_fn(marc)
+
+        # don't bother to add this to the result, since it would
+        # get stripped out anyway.
+        if field_result is None:
+            if required is True:
                 log.critical(
                     "%s requires a value, but one was not found for %s. Skipping this field.",
                     solr_field,
                     doc_id,
                 )
-                continue
-
-            if field_result is None:
-                # For values of 'None' we would expect this field to not appear in the
-                # document anyway, so we just skip any further processing or adding
-                # this value to the result document.
-                continue
-
-            if multiple and breaks:
-                # a field *must* be multivalued to support processing
-                # breaks, since a break will create a list of values.
-                full_result = []
-                for res in field_result:
-                    m = [s.strip() for s in res.split("{{brk}}") if s]
-                    full_result += m
-                # set the field result to the new values from the processed
-                # breaks.
-                field_result = full_result
-
-            if multiple and links:
-                link_result: list = []
-                for res in field_result:
-                    linked = note_links(res)
-                    link_result.append(linked)
-                field_result = link_result
-            elif multiple is False and links:
-                field_result = note_links(field_result)
-
-            if "value_prefix" in field_config:
-                if isinstance(field_result, list):
-                    prefixed_res_list = [
-                        f"{field_config['value_prefix']}{v}" for v in field_result
-                    ]
-                    solr_document[solr_field] = prefixed_res_list
-                elif isinstance(field_result, str):
-                    prefixed_value = f"{field_config['value_prefix']}{field_result}"
-                    solr_document[solr_field] = prefixed_value
-                else:
-                    value_type = type(field_result)
-                    log.warning(
-                        "A value prefix was configured for %s on %s, but %s cannot be prefixed!",
-                        solr_field,
-                        doc_id,
-                        value_type,
-                    )
-                    continue
-            else:
-                solr_document[solr_field] = field_result
-
-    return solr_document
+
+            return _SKIP
+
+        if to_json:
+            field_result = orjson.dumps(field_result).decode("utf-8")
+
+        return field_result
+
+    return field_fn
+
+
+def _compile_marc_field(
+    solr_field: str, field_config: dict, required: bool, multiple: bool
+) -> FieldFunction:
+    breaks: bool = field_config.get("breaks", False)
+    links: bool = field_config.get("links", False)
+    # Values are True, False, and None. Default is None.
+    grouping: Optional[bool] = field_config.get("grouping")
+    sortout: bool = field_config.get("sorted", True)
+    has_prefix: bool = "value_prefix" in field_config
+    value_prefix: str = str(field_config.get("value_prefix"))
+
+    # these will explode if the configuration is not correct.
+    marc_field = field_config["field"]
+    marc_subfield = field_config["subfield"]
+
+    processor_fn: Callable
+    if required and multiple:
+        processor_fn = to_solr_multi_required
+    elif not required and multiple:
+        processor_fn = to_solr_multi
+    elif required and not multiple:
+        processor_fn = to_solr_single_required
+    else:
+        # not required and not multiple, default.
+        processor_fn = to_solr_single
+
+    def field_fn(marc: pymarc.Record, doc_id: str) -> Any:
+        # This will raise an error if the processors encounter unexpected data.
+        try:
+            field_result: Any = processor_fn(
+                marc, marc_field, marc_subfield, grouping, sortout
+            )
+        except RequiredFieldException:
+            log.critical(
+                "%s requires a value, but one was not found for %s. Skipping this field.",
+                solr_field,
+                doc_id,
+            )
+            return _SKIP
+
+        if field_result is None:
+            # For values of 'None' we would expect this field to not appear in the
+            # document anyway, so we just skip any further processing or adding
+            # this value to the result document.
+            return _SKIP
+
+        if multiple and breaks:
+            # a field *must* be multivalued to support processing
+            # breaks, since a break will create a list of values.
+            field_result = [
+                s.strip() for res in field_result for s in res.split(BREAK_MARKER) if s
+            ]
+
+        if multiple and links:
+            link_result: list = []
+            for res in field_result:
+                linked = note_links(res)
+                link_result.append(linked)
+            field_result = link_result
+        elif multiple is False and links:
+            field_result = note_links(field_result)
+
+        if not has_prefix:
+            return field_result
+
+        if isinstance(field_result, list):
+            # The values are MARC subfield strings, so they can be concatenated directly.
+            return [value_prefix + v for v in field_result]
+        elif isinstance(field_result, str):
+            return value_prefix + field_result
+
+        value_type = type(field_result)
+        log.warning(
+            "A value prefix was configured for %s on %s, but %s cannot be prefixed!",
+            solr_field,
+            doc_id,
+            value_type,
+        )
+        return _SKIP
+
+    return field_fn
@@ -1,4 +1,7 @@
+import functools
 import logging
+import os
+from collections.abc import Iterator
 from typing import Callable
 
 import httpx
@@ -9,6 +12,20 @@ from indexer.exceptions import RequiredFieldException
 log = logging.getLogger("muscat_indexer")
 
 
+@functools.cache
+def _get_client() -> httpx.Client:
+    """
+    Returns a client that is shared by all the requests to Solr in this process, so that
+    connections are kept alive and reused between batches.
+    """
+    return httpx.Client(timeout=None, verify=False)  # noqa: S113, S501
+
+
+# The indexers fork worker processes, which must open their own connections rather than
+# sharing the parent's.
+os.register_at_fork(after_in_child=_get_client.cache_clear)
+
+
 def empty_solr_core(cfg: dict) -> bool:
     idx_core = cfg["solr"]["indexing_core"]
     return _empty_solr_core(cfg, idx_core)
@@ -18,12 +35,10 @@ def _empty_solr_core(cfg: dict, core: str) -> bool:
     solr_address = cfg["solr"]["server"]
     solr_idx_server: str = f"{solr_address}/{core}"
 
-    res = httpx.post(
+    res = _get_client().post(
         f"{solr_idx_server}/update?commit=true",
         content=orjson.dumps({"delete": {"query": "*:*"}}),
         headers={"Content-Type": "application/json"},
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
     )
 
     if 200 <= res.status_code < 400:
@@ -37,12 +52,10 @@ def empty_project_records(project_identifier: str, cfg: dict) -> bool:
     idx_core = cfg["solr"]["indexing_core"]
     solr_idx_server: str = f"{solr_address}/{idx_core}"
 
-    res = httpx.post(
+    res = _get_client().post(
         f"{solr_idx_server}/update?commit=true",
         content=orjson.dumps({"delete": {"query": f"project_s:{project_identifier}"}}),
         headers={"Content-Type": "application/json"},
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
     )
 
     if 200 <= res.status_code < 400:
@@ -56,6 +69,22 @@ def submit_to_solr(records: list, cfg: dict) -> bool:
     return _submit_to_solr(records, cfg, solr_idx_core)
 
 
+def _iter_records(records: list) -> Iterator[bytes]:
+    """
+    Serialises a list of records as a JSON array one record at a time, so that the
+    request body is streamed to Solr rather than built up in memory in one piece.
+
+    :param records: A list of Solr records
+    :return: An iterator over the chunks of the serialised array
+    """
+    yield b"["
+    sep: bytes = b""
+    for record in records:
+        yield sep + orjson.dumps(record)
+        sep = b","
+    yield b"]"
+
+
 def _submit_to_solr(records: list, cfg: dict, core: str) -> bool:
     """
     Submits a set of records to a Solr server.
@@ -68,12 +97,10 @@ def _submit_to_solr(records: list, cfg: dict, core: str) -> bool:
     solr_idx_server: str = f"{solr_address}/{core}"
 
     log.debug("Indexing records to Solr")
-    res = httpx.post(
+    res = _get_client().post(
         f"{solr_idx_server}/update",
-        content=orjson.dumps(records),
+        content=_iter_records(records),
         headers={"Content-Type": "application/json"},
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
     )
 
     if 200 <= res.status_code < 400:
@@ -93,7 +120,7 @@ def commit_changes(cfg: dict) -> bool:
 def _commit_changes(cfg: dict, core: str) -> bool:
     solr_address = cfg["solr"]["server"]
     solr_idx_server: str = f"{solr_address}/{core}"
-    res = httpx.get(f"{solr_idx_server}/update?commit=true", timeout=None, verify=False)  # noqa: S113, S501
+    res = _get_client().get(f"{solr_idx_server}/update?commit=true")
     if 200 <= res.status_code < 400:
         log.debug("Commit was successful")
         return True
@@ -111,10 +138,8 @@ def swap_cores(server_address: str, index_core: str, live_core: str) -> bool:
     :param live_core: The core that is currently running the service
     :return: True if swap was successful; otherwise False
     """
-    admconn = httpx.get(
-        f"{server_address}/admin/cores?action=SWAP&core={index_core}&other={live_core}",
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
+    admconn = _get_client().get(
+        f"{server_address}/admin/cores?action=SWAP&core={index_core}&other={live_core}"
     )
 
     if 200 <= admconn.status_code < 400:
@@ -141,10 +166,8 @@ def reload_core(server_address: str, core_name: str) -> bool:
     :param core_name: The name of the core to reload.
     :return: True if the reload was successful, otherwise False.
     """
-    admconn = httpx.get(
-        f"{server_address}/admin/cores?action=RELOAD&core={core_name}",
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
+    admconn = _get_client().get(
+        f"{server_address}/admin/cores?action=RELOAD&core={core_name}"
     )
 
     if 200 <= admconn.status_code < 400:
@@ -162,11 +185,7 @@ def exists(document_id: str, cfg: dict) -> bool:
     solr_core = cfg["solr"]["indexing_core"]
     solr_idx_server: str = f"{solr_address}/{solr_core}"
 
-    res = httpx.get(
-        f"{solr_idx_server}/get?id={document_id}&fl=id",
-        timeout=None,  # noqa: S113
-        verify=False,  # noqa: S501
-    )
+    res = _get_client().get(f"{solr_idx_server}/get?id={document_id}&fl=id")
     if 200 <= res.status_code < 400:
         json_body = res.json()
         return "doc" in json_body and json_body["doc"] is not None
@@ -2,7 +2,7 @@ import concurrent.futures
 import dataclasses
 import logging
 import re
-import timeit
+import time
 from collections import OrderedDict
 from functools import wraps
 from typing import Callable, Iterable, Optional, Pattern, TypedDict
@@ -29,9 +29,9 @@ def elapsedtime(func) -> Callable:
     def timed_f(*args, **kwargs) -> Callable:
         fname = func.__name__
         log.debug(" --- Timing execution for %s ---", fname)
-        start = timeit.default_timer()
+        start = time.perf_counter()
         ret = func(*args, **kwargs)
-        end = timeit.default_timer()
+        end = time.perf_counter()
         elapsed: float = end - start
 
         hours, remainder = divmod(elapsed, 60 * 60)
@@ -688,13 +688,22 @@ class ContentTypes:
     OTHER = "Other"
 
 
+# The index value for each content type, in the order they are added to a record.
+CONTENT_TYPE_LABELS: tuple[tuple[str, str], ...] = (
+    (ContentTypes.LIBRETTO, "libretto"),
+    (ContentTypes.TREATISE, "treatise"),
+    (ContentTypes.NOTATED_MUSIC, "musical"),
+    (ContentTypes.MIXED, "mixed"),
+    (ContentTypes.OTHER, "other"),
+)
+CONTENT_TYPE_LABELS_BY_TYPE: dict[str, str] = dict(CONTENT_TYPE_LABELS)
+
+
 def get_content_types(record: Optional[pymarc.Record]) -> list[str]:
     """
     Takes all record types associated with this record, and returns a list of
     all possible content types for it.
 
-    Checks if two sets have an intersection set (that they have members overlapping).
-
     :param record: A pymarc Record field
     :return: A list of index values containing the content types.
     """
@@ -702,28 +711,20 @@ def get_content_types(record: Optional[pymarc.Record]) -> list[str]:
         return []
 
     all_content_types: Optional[list[str]] = to_solr_multi(record, "593", "b")
-    ret: list = []
-
     if not all_content_types:
         return []
 
-    all_types: set = set(all_content_types)
-    if all_types & {ContentTypes.LIBRETTO}:
-        ret.append("libretto")
-
-    if all_types & {ContentTypes.TREATISE}:
-        ret.append("treatise")
+    # Most records only have a single content type, so look that up directly.
+    if len(all_content_types) == 1:
+        label: Optional[str] = CONTENT_TYPE_LABELS_BY_TYPE.get(all_content_types[0])
+        return [label] if label else []
 
-    if all_types & {ContentTypes.NOTATED_MUSIC}:
-        ret.append("musical")
-
-    if all_types & {ContentTypes.MIXED}:
-        ret.append("mixed")
-
-    if all_types & {ContentTypes.OTHER}:
-        ret.append("other")
-
-    return ret
+    all_types: set = set(all_content_types)
+    return [
+        label
+        for content_type, label in CONTENT_TYPE_LABELS
+        if content_type in all_types
+    ]
 
 
 def get_parent_order_for_members(
@@ -2,7 +2,7 @@ import logging
 from collections import deque
 from typing import Generator
 
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 from indexer.helpers.solr import submit_to_solr
 from indexer.helpers.utilities import parallelise
 from indexer.records.digital_object import create_digital_object_index_document
@@ -12,7 +12,7 @@ log = logging.getLogger("muscat_indexer")
 
 def _get_digital_objects(cfg: dict) -> Generator[dict, None, None]:
     log.info("Getting list of digital objects to index")
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     dbname: str = cfg["mysql"]["database"]
 
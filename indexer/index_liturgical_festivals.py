@@ -1,6 +1,6 @@
 import logging
 
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 from indexer.helpers.solr import submit_to_solr
 from indexer.records.liturgical_festival import (
     LiturgicalFestivalIndexDocument,
@@ -12,7 +12,7 @@ log = logging.getLogger("muscat_indexer")
 
 def index_liturgical_festivals(cfg: dict) -> bool:
     log.info("Indexing Liturgical Festivals")
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     dbname: str = cfg["mysql"]["database"]
 
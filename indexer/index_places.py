@@ -1,6 +1,6 @@
 import logging
 
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 from indexer.helpers.solr import submit_to_solr
 from indexer.records.place import PlaceIndexDocument, create_place_index_document
 
@@ -9,7 +9,7 @@ log = logging.getLogger("muscat_indexer")
 
 def index_places(cfg: dict) -> bool:
     log.info("Indexing Places")
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     dbname: str = cfg["mysql"]["database"]
 
@@ -4,7 +4,7 @@ from collections import deque
 from typing import Generator
 
 from indexer.exceptions import RequiredFieldException
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 from indexer.helpers.solr import submit_to_solr
 from indexer.helpers.utilities import parallelise
 from indexer.records.source import create_source_index_documents
@@ -14,7 +14,7 @@ log = logging.getLogger("muscat_indexer")
 
 def _get_sources(cfg: dict) -> Generator[dict, None, None]:
     log.info("Getting list of sources to index")
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     dbname: str = cfg["mysql"]["database"]
 
@@ -27,9 +27,9 @@ def _get_external_ids(record: pymarc.Record) -> Optional[list]:
     ids: list[pymarc.Field] = record.get_fields("024")
 
     return [
-        f"{idf['2'].lower()}:{idf['a']}"
+        f"{id_source.lower()}:{id_value}"
         for idf in ids
-        if (idf and idf.get("2") and idf.get("a"))
+        if (idf and (id_source := idf.get("2")) and (id_value := idf.get("a")))
     ]
 
 
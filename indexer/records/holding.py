@@ -3,8 +3,8 @@ from typing import Optional, TypedDict
 
 import orjson
 import pymarc
-import yaml
 
+from indexer.helpers.config import load_config
 from indexer.helpers.identifiers import get_record_type, get_source_type
 from indexer.helpers.marc import create_marc
 from indexer.helpers.profiles import process_marc_profile
@@ -18,8 +18,8 @@ from indexer.helpers.utilities import (
 from indexer.processors import holding as holding_processor
 
 log = logging.getLogger("muscat_indexer")
-holding_profile: dict = yaml.full_load(open("profiles/holdings.yml"))  # noqa: SIM115
-mss_holding_profile: dict = yaml.full_load(open("profiles/holdingsmss.yml"))  # noqa: SIM115
+holding_profile: dict = load_config("profiles/holdings.yml")
+mss_holding_profile: dict = load_config("profiles/holdingsmss.yml")
 
 
 class HoldingIndexDocument(TypedDict):
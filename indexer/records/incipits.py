@@ -5,7 +5,6 @@ from typing import Optional, TypedDict
 import orjson
 import pymarc
 import verovio
-import yaml
 
 from indexer.helpers.datelib import process_date_statements
 from indexer.helpers.identifiers import get_record_type, get_source_type
@@ -18,7 +17,6 @@ from indexer.helpers.utilities import (
 )
 
 log = logging.getLogger("muscat_indexer")
-index_config: dict = yaml.full_load(open("index_config.yml"))  # noqa: SIM115
 
 RenderedPAE = namedtuple("RenderedPAE", ["svg", "midi", "features"])
 verovio.enableLog(False)  # noqa
@@ -3,8 +3,8 @@ from typing import Optional, TypedDict
 
 import orjson
 import pymarc
-import yaml
 
+from indexer.helpers.config import load_config
 from indexer.helpers.marc import create_marc
 from indexer.helpers.profiles import process_marc_profile
 from indexer.helpers.utilities import (
@@ -15,7 +15,7 @@ from indexer.helpers.utilities import (
 from indexer.processors import institution as institution_processor
 
 log = logging.getLogger("muscat_indexer")
-institution_profile: dict = yaml.full_load(open("profiles/institutions.yml"))
+institution_profile: dict = load_config("profiles/institutions.yml")
 
 
 class InstitutionIndexDocument(TypedDict):
@@ -2,15 +2,15 @@ import logging
 from typing import Optional, TypedDict
 
 import pymarc
-import yaml
 
+from indexer.helpers.config import load_config
 from indexer.helpers.marc import create_marc
 from indexer.helpers.profiles import process_marc_profile
 from indexer.helpers.utilities import normalize_id
 from indexer.processors import person as person_processor
 
 log = logging.getLogger("muscat_indexer")
-person_profile: dict = yaml.full_load(open("profiles/people.yml"))  # noqa: SIM115
+person_profile: dict = load_config("profiles/people.yml")
 
 
 class PersonIndexDocument(TypedDict):
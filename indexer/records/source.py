@@ -3,8 +3,8 @@ from typing import Optional
 
 import orjson
 import pymarc
-import yaml
 
+from indexer.helpers.config import load_config
 from indexer.helpers.identifiers import (
     country_code_from_siglum,
     get_is_collection_record,
@@ -31,11 +31,7 @@ from indexer.records.holding import HoldingIndexDocument, holding_index_document
 from indexer.records.incipits import get_incipits
 
 log = logging.getLogger("muscat_indexer")
-with open("index_config.yml") as idx_cf:
-    index_config: dict = yaml.full_load(idx_cf)
-
-with open("profiles/sources.yml") as source_pf:
-    source_profile: dict = yaml.full_load(source_pf)
+source_profile: dict = load_config("profiles/sources.yml")
 
 
 def create_source_index_documents(record: dict, cfg: dict) -> list:
@@ -509,9 +505,7 @@ def _get_has_iiif_manifest(all_records: list[pymarc.Record]) -> bool:
             continue
 
         for f in record.get_fields("856"):
-            if "x" not in f:
-                continue
-            if f["x"] in iiif_labels:
+            if f.get("x") in iiif_labels:
                 return True
 
     return False
@@ -522,8 +516,9 @@ def _get_digitization_notes(all_records: list[pymarc.Record]) -> list[str]:
     for record in all_records:
         if "856" not in record:
             continue
-        recnotes: set = {f["z"] for f in record.get_fields("856") if "z" in f}
-        all_project_notes |= recnotes
+        all_project_notes.update(
+            note for f in record.get_fields("856") if (note := f.get("z")) is not None
+        )
 
     return list(all_project_notes)
 
@@ -2,8 +2,8 @@ from typing import Optional
 
 import orjson
 import pymarc
-import yaml
 
+from indexer.helpers.config import load_config
 from indexer.helpers.marc import create_marc
 from indexer.helpers.profiles import process_marc_profile
 from indexer.helpers.utilities import (
@@ -12,7 +12,7 @@ from indexer.helpers.utilities import (
 )
 from indexer.processors import work as work_processor
 
-work_profile: dict = yaml.full_load(open("profiles/works.yml"))  # noqa: SIM115
+work_profile: dict = load_config("profiles/works.yml")
 
 
 def create_work_index_documents(record: dict, cfg: dict) -> list:
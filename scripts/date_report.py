@@ -9,7 +9,7 @@ import edtf
 import yaml
 from edtf.parser.edtf_exceptions import EDTFParseException
 
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 from indexer.helpers.marc import create_marc
 from indexer.helpers.utilities import to_solr_multi
 
@@ -363,7 +363,7 @@ if __name__ == "__main__":
     ORDER BY child.id desc;
     """
 
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
 
     curs.execute(query)
@@ -1,10 +1,10 @@
-from indexer.helpers.db import mysql_pool
+from indexer.helpers.db import get_mysql_pool
 import concurrent.futures
 from typing import List, Generator
 
 
 def _do_query() -> Generator:
-    conn = mysql_pool.connection()
+    conn = get_mysql_pool().connection()
     curs = conn.cursor()
     res: List[List] = []
 